@@ -57,6 +57,18 @@ class ArgInfo : public runtime::ObjectRef {
    * \return An array of the argument information derived.
    */
   TVM_DLL static Array<ArgInfo, void> FromPrimFunc(const tir::PrimFunc& func);
+  /*!
+   * \brief Converts an array of ArgInfo to its corresponding JSON representation in one pass.
+   * \param arg_infos The array of ArgInfo to be converted.
+   * \return The JSON representation, an array of the per-element JSON objects.
+   */
+  TVM_DLL static ObjectRef ArrayAsJSON(const Array<ArgInfo, void>& arg_infos);
+  /*!
+   * \brief Parse an array of argument information from a JSON object.
+   * \param json_obj The json object to parse, an array of per-element JSON objects.
+   * \return The array of argument information parsed.
+   */
+  TVM_DLL static Array<ArgInfo, void> ArrayFromJSON(const ObjectRef& json_obj);
 
   TVM_DEFINE_MUTABLE_NOTNULLABLE_OBJECT_REF_METHODS(ArgInfo, runtime::ObjectRef, ArgInfoNode);
 
@@ -82,6 +94,16 @@ class TensorInfoNode : public ArgInfoNode {
 
  public:
   ObjectRef AsJSON() const;
+  /*!
+   * \brief Get the canonical repr of the tensor info.
+   * \return The repr, computed on first call and cached afterwards.
+   * \note The cache never needs invalidation because `dtype` and `shape` are immutable.
+   */
+  const String& Repr() const;
+
+ private:
+  /*! \brief The cached repr, lazily populated by `Repr`. */
+  mutable String repr_cache_;
 };
 
 /*!
@@ -49,6 +49,38 @@ class ArgInfo(Object):
         """
         return _ffi_api.ArgInfoFromJSON(json_obj)  # type: ignore # pylint: disable=no-member
 
+    @staticmethod
+    def batch_as_json(arg_infos: List["ArgInfo"]) -> List[Any]:
+        """Convert a list of ArgInfo to their JSON representations in a single FFI call.
+
+        Parameters
+        ----------
+        arg_infos : List[ArgInfo]
+            The list of ArgInfo to be converted.
+
+        Returns
+        -------
+        json_objs : List[Any]
+            The list of the corresponding JSON representations.
+        """
+        return _json_de_tvm(_ffi_api.ArgInfoArrayAsJSON(arg_infos))  # type: ignore # pylint: disable=no-member
+
+    @staticmethod
+    def batch_from_json(json_objs: List[Any]) -> List["ArgInfo"]:
+        """Parse a list of argument information from JSON objects in a single FFI call.
+
+        Parameters
+        ----------
+        json_objs : List[Any]
+            The list of json objects to parse.
+
+        Returns
+        -------
+        parsed : List[ArgInfo]
+            The list of argument information parsed.
+        """
+        return _ffi_api.ArgInfoArrayFromJSON(json_objs)  # type: ignore # pylint: disable=no-member
+
     @staticmethod
     def from_prim_func(func: PrimFunc) -> List["ArgInfo"]:
         """Extract a list of the argument information from PrimFunc.
@@ -62,6 +94,12 @@ class ArgInfo(Object):
         -------
         extracted : List[ArgInfo]
             An array of the argument information derived.
+
+        Note
+        ----
+        The extraction runs entirely on the C++ side in a single FFI call; the
+        returned TVM array only materializes Python wrappers for its elements
+        when they are accessed.
         """
         return _ffi_api.ArgInfoFromPrimFunc(func)  # type: ignore # pylint: disable=no-member
 
@@ -94,6 +132,12 @@ class TensorInfo(ArgInfo):
             The data type of the tensor.
         shape : ShapeTuple
             The shape of the tensor.
+
+        Note
+        ----
+        When a plain list is given, it is converted and validated by the
+        `ShapeTuple` constructor on the C++ side in a single FFI call;
+        no Python-side loop over the dimensions is involved.
         """
         if isinstance(shape, ShapeTuple):
             shape_tuple = shape
@@ -104,3 +148,9 @@ class TensorInfo(ArgInfo):
             dtype,
             shape_tuple,
         )
+
+    def __str__(self) -> str:
+        """Return the canonical repr cached on the C++ side."""
+        return _ffi_api.TensorInfoRepr(self)  # type: ignore # pylint: disable=no-member
+
+    __repr__ = __str__
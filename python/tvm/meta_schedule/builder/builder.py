@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 """Meta Schedule builders that translate IRModule to runtime.Module, and then export"""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from tvm._ffi import register_object
 from tvm.ir import IRModule
@@ -37,6 +37,11 @@ class BuilderInput(Object):
         The target to be built for.
     """
 
+    # The FFI object handle lives in a base-class slot; declaring empty slots here
+    # keeps instances dict-free, which matters when the task scheduler materializes
+    # thousands of inputs per tuning round.
+    __slots__ = []
+
     mod: IRModule
     target: Target
 
@@ -69,6 +74,8 @@ class BuilderResult(Object):
         The error message.
     """
 
+    __slots__ = []
+
     artifact_path: Optional[str]
     error_msg: Optional[str]
 
@@ -92,6 +99,56 @@ class BuilderResult(Object):
             error_msg,
         )
 
+    @staticmethod
+    def batch_pack(
+        artifact_paths: List[Optional[str]],
+        error_msgs: List[Optional[str]],
+    ) -> List["BuilderResult"]:
+        """Construct a list of BuilderResults in a single FFI call.
+
+        Parameters
+        ----------
+        artifact_paths : List[Optional[str]]
+            The artifact path of each result.
+        error_msgs : List[Optional[str]]
+            The error message of each result.
+
+        Returns
+        -------
+        builder_results : List[BuilderResult]
+            The constructed results.
+        """
+        return _ffi_api.BuilderResultArrayPack(  # type: ignore # pylint: disable=no-member
+            artifact_paths,
+            error_msgs,
+        )
+
+    @staticmethod
+    def batch_unpack(
+        builder_results: List["BuilderResult"],
+    ) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """Unpack the fields of a list of BuilderResults in a single FFI call.
+
+        Parameters
+        ----------
+        builder_results : List[BuilderResult]
+            The results to be unpacked.
+
+        Returns
+        -------
+        artifact_paths : List[Optional[str]]
+            The artifact path of each result.
+        error_msgs : List[Optional[str]]
+            The error message of each result.
+        """
+        artifact_paths, error_msgs = _ffi_api.BuilderResultArrayUnpack(  # type: ignore # pylint: disable=no-member
+            builder_results
+        )
+        return (
+            [path if path is None else str(path) for path in artifact_paths],
+            [msg if msg is None else str(msg) for msg in error_msgs],
+        )
+
 
 @register_object("meta_schedule.Builder")
 class Builder(Object):
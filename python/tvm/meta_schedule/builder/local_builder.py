@@ -15,19 +15,30 @@
 # specific language governing permissions and limitations
 # under the License.
 """Local builder that compile on the local host"""
+import hashlib
 import os
+import shutil
+import signal
 import tempfile
-from typing import Callable, List, Optional, Union
+import traceback
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Tuple, Union
 
 from tvm._ffi import register_func
-from tvm.ir import IRModule
+from tvm.ir import IRModule, load_json, save_json
 from tvm.runtime import Module
 from tvm.target import Target
 
 from ...contrib.popen_pool import MapResult, PopenPoolExecutor, StatusKind
+from .. import _ffi_api
 from ..utils import cpu_count, get_global_func_with_default_on_worker
 from .builder import BuilderInput, BuilderResult, PyBuilder
 
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
 
 class LocalBuilder(PyBuilder):
     """A builder that builds the given input on local host.
@@ -44,6 +55,8 @@ class LocalBuilder(PyBuilder):
     f_export : Union[None, str, LocalBuilder.T_EXPORT]
         Name of the export function to be used.
         Defaults to `meta_schedule.builder.default_export`.
+    cache_dir : Optional[str]
+        The directory of the content-addressed artifact cache, if enabled.
 
     Attributes
     ----------
@@ -56,6 +69,11 @@ class LocalBuilder(PyBuilder):
 
     Note
     ----
+    The builder is backed by a persistent `PopenPoolExecutor`: the inputs of each
+    `build` call are dispatched to the worker processes in parallel, and the workers,
+    together with the cost of running `initializer` in them, are reused across
+    `build` calls until the builder is destructed.
+
     The build function and export function should be registered in the worker process.
     The worker process is only aware of functions registered in TVM package,
     if there are extra functions to be registered,
@@ -65,10 +83,11 @@ class LocalBuilder(PyBuilder):
     T_BUILD = Callable[[IRModule, Target], Module]
     T_EXPORT = Callable[[Module], str]
 
-    pool: PopenPoolExecutor
+    pool: Optional[PopenPoolExecutor]
     timeout_sec: float
     f_build: Union[None, str, T_BUILD]
     f_export: Union[None, str, T_EXPORT]
+    cache_dir: Optional[str]
 
     def __init__(
         self,
@@ -78,6 +97,8 @@ class LocalBuilder(PyBuilder):
         f_build: Union[None, str, T_BUILD] = None,
         f_export: Union[None, str, T_EXPORT] = None,
         initializer: Optional[Callable[[], None]] = None,
+        cache_dir: Optional[str] = None,
+        _use_signal_timeout: bool = False,
     ) -> None:
         """Constructor.
 
@@ -96,64 +117,185 @@ class LocalBuilder(PyBuilder):
             Defaults to `meta_schedule.builder.default_export`.
         initializer : Optional[Callable[[], None]]
             The initializer to be used for the worker processes.
+        cache_dir : Optional[str]
+            If given, the directory of a content-addressed cache of built artifacts,
+            keyed by the hash of the serialized (mod, target) pair. A cache hit skips
+            `f_build` and `f_export` entirely and copies the cached artifact into a
+            fresh temp dir. Disabled by default; only enable it when `f_build` and
+            `f_export` are deterministic, since they are not part of the key.
+        _use_signal_timeout : bool
+            If True, run the builds in the host process and enforce `timeout_sec`
+            with a SIGALRM timer instead of dispatching to the worker pool.
+            This removes the process-spawn cost, but loses crash isolation and
+            requires running on the main thread of a platform that provides
+            SIGALRM, so it is intended for testing error paths only.
         """
         super().__init__()
 
         if max_workers is None:
             max_workers = cpu_count()
 
-        self.pool = PopenPoolExecutor(
-            max_workers=max_workers,
-            timeout=timeout_sec,
-            initializer=initializer,
-        )
+        self._use_signal_timeout = _use_signal_timeout
+        if _use_signal_timeout:
+            if not hasattr(signal, "SIGALRM"):
+                raise ValueError("LocalBuilder: SIGALRM is not available on this platform")
+            self.pool = None
+            if initializer is not None:
+                initializer()
+        else:
+            self.pool = PopenPoolExecutor(
+                max_workers=max_workers,
+                timeout=timeout_sec,
+                initializer=initializer,
+            )
         self.timeout_sec = timeout_sec
         self.f_build = f_build
         self.f_export = f_export
+        self.cache_dir = cache_dir
         self._sanity_check()
 
+    @contextmanager
+    def override(
+        self,
+        *,
+        timeout_sec: Optional[float] = None,
+        f_build: Union[None, str, T_BUILD] = None,
+        f_export: Union[None, str, T_EXPORT] = None,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        """Temporarily rebind the build/export functions and timeout of the builder.
+
+        Only the arguments given are overridden, and the previous values are restored
+        on exit. This allows a single builder instance to be shared by use sites that
+        each need their own functions, e.g. across tests, instead of paying the
+        builder construction cost per site.
+
+        Parameters
+        ----------
+        timeout_sec : Optional[float]
+            The timeout in seconds for the build, if overridden.
+        f_build : Union[None, str, LocalBuilder.T_BUILD]
+            Name of the build function to be used, if overridden.
+        f_export : Union[None, str, LocalBuilder.T_EXPORT]
+            Name of the export function to be used, if overridden.
+        initializer : Optional[Callable[[], None]]
+            An initializer to run before the overridden functions are used.
+            Only supported on the in-process builder: workers already started
+            in the pool would not re-run it.
+        """
+        if initializer is not None and not self._use_signal_timeout:
+            raise ValueError(
+                "LocalBuilder: overriding `initializer` requires the in-process builder, "
+                "because workers already started in the pool will not re-run it"
+            )
+        saved = (self.timeout_sec, self.f_build, self.f_export)
+        if timeout_sec is not None:
+            self.timeout_sec = timeout_sec
+            if self.pool is not None:
+                # keep the pool's enforcement in sync with the reported timeout
+                self.pool._timeout = timeout_sec  # pylint: disable=protected-access
+        if f_build is not None:
+            self.f_build = f_build
+        if f_export is not None:
+            self.f_export = f_export
+        if initializer is not None:
+            initializer()
+        try:
+            self._sanity_check()
+            yield self
+        finally:
+            self.timeout_sec, self.f_build, self.f_export = saved
+            if timeout_sec is not None and self.pool is not None:
+                self.pool._timeout = self.timeout_sec  # pylint: disable=protected-access
+
     def build(self, build_inputs: List[BuilderInput]) -> List[BuilderResult]:
-        results: List[BuilderResult] = []
+        if self._use_signal_timeout:
+            return self._build_with_signal_timeout(build_inputs)
+
+        artifact_paths: List[Optional[str]] = []
+        error_msgs: List[Optional[str]] = []
         map_result: MapResult
+        timeout_msg = f"LocalBuilder: Timeout, killed after {self.timeout_sec} seconds"
 
-        # Dispatch the build inputs to the worker processes.
-        for map_result in self.pool.map_with_error_catching(
-            lambda x: LocalBuilder._worker_func(*x),
-            [
-                (
-                    self.f_build,
-                    self.f_export,
-                    build_input.mod,
-                    build_input.target,
-                )
-                for build_input in build_inputs
-            ],
-        ):
-            if map_result.status == StatusKind.COMPLETE:
-                results.append(BuilderResult(map_result.value, None))
-            elif map_result.status == StatusKind.TIMEOUT:
-                results.append(
-                    BuilderResult(
-                        None,
-                        f"LocalBuilder: Timeout, killed after {self.timeout_sec} seconds",
+        # Unpack the (mod, target) pairs of all inputs in a single FFI call,
+        # instead of reading the two properties per input.
+        mods, targets = _unpack_build_inputs(build_inputs)
+        # Hand the modules to the workers via shared memory where available,
+        # so they are not pickled through the worker pipes.
+        shared_blocks: List["shared_memory.SharedMemory"] = []
+        if shared_memory is not None:
+            mods = [_share_module(mod, shared_blocks) for mod in mods]
+        try:
+            # Dispatch the build inputs to the worker processes.
+            for map_result in self.pool.map_with_error_catching(
+                lambda x: LocalBuilder._worker_func(*x),
+                [
+                    (
+                        self.f_build,
+                        self.f_export,
+                        mod,
+                        target,
+                        self.cache_dir,
                     )
-                )
-            elif map_result.status == StatusKind.EXCEPTION:
-                results.append(
-                    BuilderResult(
-                        None,
-                        "LocalBuilder: An exception occurred\n" + str(map_result.value),
+                    for mod, target in zip(mods, targets)
+                ],
+            ):
+                if map_result.status == StatusKind.COMPLETE:
+                    artifact_paths.append(map_result.value)
+                    error_msgs.append(None)
+                elif map_result.status == StatusKind.TIMEOUT:
+                    artifact_paths.append(None)
+                    error_msgs.append(timeout_msg)
+                elif map_result.status == StatusKind.EXCEPTION:
+                    artifact_paths.append(None)
+                    error_msgs.append(
+                        "LocalBuilder: An exception occurred\n" + str(map_result.value)
                     )
+                else:
+                    raise ValueError("Unreachable: unexpected result: {map_result}")
+        finally:
+            for shared_block in shared_blocks:
+                shared_block.close()
+                shared_block.unlink()
+        # Construct all the results in a single FFI call, instead of one per input.
+        return BuilderResult.batch_pack(artifact_paths, error_msgs)
+
+    def _build_with_signal_timeout(self, build_inputs: List[BuilderInput]) -> List[BuilderResult]:
+        """Build in the host process, enforcing `timeout_sec` with a SIGALRM timer."""
+        artifact_paths: List[Optional[str]] = []
+        error_msgs: List[Optional[str]] = []
+        timeout_msg = f"LocalBuilder: Timeout, killed after {self.timeout_sec} seconds"
+        mods, targets = _unpack_build_inputs(build_inputs)
+        for mod, target in zip(mods, targets):
+            try:
+                with _signal_timer(self.timeout_sec):
+                    artifact_path = LocalBuilder._worker_func(
+                        self.f_build,
+                        self.f_export,
+                        mod,
+                        target,
+                        self.cache_dir,
+                    )
+                artifact_paths.append(artifact_path)
+                error_msgs.append(None)
+            except TimeoutError:
+                artifact_paths.append(None)
+                error_msgs.append(timeout_msg)
+            except Exception:  # pylint: disable=broad-except
+                artifact_paths.append(None)
+                error_msgs.append(
+                    "LocalBuilder: An exception occurred\n" + traceback.format_exc()
                 )
-            else:
-                raise ValueError("Unreachable: unexpected result: {map_result}")
-        return results
+        return BuilderResult.batch_pack(artifact_paths, error_msgs)
 
     def _sanity_check(self) -> None:
         def _check(f_build, f_export) -> None:
             get_global_func_with_default_on_worker(name=f_build, default=None)
             get_global_func_with_default_on_worker(name=f_export, default=None)
 
+        if self.pool is None:
+            _check(self.f_build, self.f_export)
+            return
         value = self.pool.submit(_check, self.f_build, self.f_export)
         value.result()
 
@@ -161,8 +303,9 @@ class LocalBuilder(PyBuilder):
     def _worker_func(
         _f_build: Union[None, str, T_BUILD],
         _f_export: Union[None, str, T_EXPORT],
-        mod: IRModule,
+        mod: Union[IRModule, Tuple[str, int]],
         target: Target,
+        cache_dir: Optional[str] = None,
     ) -> str:
         # Step 0. Get the registered functions
         f_build: LocalBuilder.T_BUILD = get_global_func_with_default_on_worker(
@@ -173,13 +316,119 @@ class LocalBuilder(PyBuilder):
             _f_export,
             default_export,
         )
-        # Step 1. Build the IRModule
+        if isinstance(mod, tuple):
+            mod = _load_shared_module(*mod)
+        # Step 1. Look up the artifact cache
+        if cache_dir is not None:
+            artifact_path = _fetch_cached_artifact(cache_dir, mod, target)
+            if artifact_path is not None:
+                return artifact_path
+        # Step 2. Build the IRModule
         rt_mod: Module = f_build(mod, target)
-        # Step 2. Export the Module
+        # Step 3. Export the Module
         artifact_path: str = f_export(rt_mod)
+        if cache_dir is not None:
+            _store_cached_artifact(cache_dir, mod, target, artifact_path)
         return artifact_path
 
 
+def _artifact_cache_key(mod: IRModule, target: Target) -> str:
+    """Content hash of a (mod, target) pair, used as the artifact cache key"""
+    return hashlib.sha256(save_json(mod).encode() + str(target).encode()).hexdigest()
+
+
+def _fetch_cached_artifact(cache_dir: str, mod: IRModule, target: Target) -> Optional[str]:
+    """Copy the cached artifact of a (mod, target) pair into a fresh temp dir, if any"""
+    entry_dir = os.path.join(cache_dir, _artifact_cache_key(mod, target))
+    if not os.path.isdir(entry_dir):
+        return None
+    artifacts = os.listdir(entry_dir)
+    if len(artifacts) != 1:
+        return None
+    artifact_path = os.path.join(tempfile.mkdtemp(), artifacts[0])
+    shutil.copy(os.path.join(entry_dir, artifacts[0]), artifact_path)
+    return artifact_path
+
+
+def _store_cached_artifact(
+    cache_dir: str,
+    mod: IRModule,
+    target: Target,
+    artifact_path: str,
+) -> None:
+    """Insert the artifact into the cache with an atomic rename"""
+    entry_dir = os.path.join(cache_dir, _artifact_cache_key(mod, target))
+    if os.path.isdir(entry_dir):
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(dir=cache_dir)
+    shutil.copy(artifact_path, staging_dir)
+    try:
+        os.rename(staging_dir, entry_dir)
+    except OSError:
+        # another worker inserted the same entry first
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _share_module(mod: IRModule, shared_blocks: List) -> Tuple[str, int]:
+    """Serialize the module into a new shared-memory block, returning its (name, size).
+
+    The block is appended to `shared_blocks`; the caller owns its lifetime and must
+    unlink it once the workers are done.
+    """
+    blob = save_json(mod).encode()
+    shared_block = shared_memory.SharedMemory(create=True, size=len(blob))
+    shared_block.buf[: len(blob)] = blob
+    shared_blocks.append(shared_block)
+    return (shared_block.name, len(blob))
+
+
+def _load_shared_module(shared_block_name: str, size: int) -> IRModule:
+    """Load the module serialized into the named shared-memory block"""
+    shared_block = shared_memory.SharedMemory(name=shared_block_name)
+    try:
+        json_str = bytes(shared_block.buf[:size]).decode()
+    finally:
+        shared_block.close()
+        # Attaching also registers the segment with this process's resource
+        # tracker (bpo-39959). The parent owns the block and unlinks it, so
+        # drop the registration here lest long-lived workers accumulate stale
+        # entries and warn about "leaked" segments on shutdown.
+        resource_tracker.unregister(
+            shared_block._name,  # pylint: disable=protected-access
+            "shared_memory",
+        )
+    return load_json(json_str)
+
+
+def _unpack_build_inputs(build_inputs: List[BuilderInput]):
+    """Unpack the modules and targets of the build inputs in a single FFI call"""
+    mods, targets = _ffi_api.BuilderInputArrayUnpack(  # type: ignore # pylint: disable=no-member
+        build_inputs
+    )
+    return mods, targets
+
+
+@contextmanager
+def _signal_timer(seconds: float):
+    """Raise `TimeoutError` in the current thread after `seconds` via a SIGALRM timer.
+
+    The previous handler and timer are restored on exit. Only usable on the main
+    thread of platforms that provide SIGALRM.
+    """
+
+    def _handler(signum, frame):  # pylint: disable=unused-argument
+        raise TimeoutError()
+
+    previous = signal.signal(signal.SIGALRM, _handler)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0.0)
+        signal.signal(signal.SIGALRM, previous)
+
+
 @register_func("meta_schedule.builder.default_build")
 def default_build(mod: IRModule, target: Target) -> Module:
     """Default build function.
@@ -16,6 +16,8 @@
  * specific language governing permissions and limitations
  * under the License.
  */
+#include <sstream>
+
 #include "./utils.h"
 
 namespace tvm {
@@ -60,6 +62,26 @@ Array<ArgInfo> ArgInfo::FromPrimFunc(const tir::PrimFunc& func) {
   return result;
 }
 
+ObjectRef ArgInfo::ArrayAsJSON(const Array<ArgInfo>& arg_infos) {
+  Array<ObjectRef> result;
+  result.reserve(arg_infos.size());
+  for (const ArgInfo& arg_info : arg_infos) {
+    result.push_back(arg_info->AsJSON());
+  }
+  return result;
+}
+
+Array<ArgInfo> ArgInfo::ArrayFromJSON(const ObjectRef& json_obj) {
+  const ArrayNode* json_array = json_obj.as<ArrayNode>();
+  CHECK(json_array) << "ValueError: Unable to parse the JSON object: " << json_obj;
+  Array<ArgInfo> result;
+  result.reserve(json_array->size());
+  for (const ObjectRef& json_elem : *json_array) {
+    result.push_back(ArgInfo::FromJSON(json_elem));
+  }
+  return result;
+}
+
 /******** TensorInfo ********/
 
 TensorInfo::TensorInfo(runtime::DataType dtype, runtime::ShapeTuple shape) {
@@ -98,11 +120,22 @@ TensorInfo TensorInfo::FromJSON(const ObjectRef& json_obj) {
 
 /******** Repr ********/
 
+const String& TensorInfoNode::Repr() const {
+  // A default-constructed String is a defined empty string, so emptiness, not
+  // definedness, marks the cache as unpopulated. The repr itself is never empty.
+  if (repr_cache_.empty()) {
+    std::ostringstream os;
+    os << "TensorInfo(\"" << this->dtype << "\", " << this->shape << ")";
+    repr_cache_ = os.str();
+  }
+  return repr_cache_;
+}
+
 TVM_STATIC_IR_FUNCTOR(ReprPrinter, vtable)
     .set_dispatch<TensorInfoNode>([](const ObjectRef& n, ReprPrinter* p) {
       const auto* self = n.as<TensorInfoNode>();
       ICHECK(self);
-      p->stream << "TensorInfo(\"" << self->dtype << "\", " << self->shape << ")";
+      p->stream << self->Repr();
     });
 
 /******** FFI ********/
@@ -113,10 +146,15 @@ TVM_REGISTER_NODE_TYPE(TensorInfoNode);
 TVM_REGISTER_GLOBAL("meta_schedule.ArgInfoAsJSON").set_body_method<ArgInfo>(&ArgInfoNode::AsJSON);
 TVM_REGISTER_GLOBAL("meta_schedule.ArgInfoFromPrimFunc").set_body_typed(ArgInfo::FromPrimFunc);
 TVM_REGISTER_GLOBAL("meta_schedule.ArgInfoFromJSON").set_body_typed(ArgInfo::FromJSON);
+TVM_REGISTER_GLOBAL("meta_schedule.ArgInfoArrayAsJSON").set_body_typed(ArgInfo::ArrayAsJSON);
+TVM_REGISTER_GLOBAL("meta_schedule.ArgInfoArrayFromJSON").set_body_typed(ArgInfo::ArrayFromJSON);
 TVM_REGISTER_GLOBAL("meta_schedule.TensorInfo")
     .set_body_typed([](runtime::DataType dtype, runtime::ShapeTuple shape) -> TensorInfo {
       return TensorInfo(dtype, shape);
     });
+TVM_REGISTER_GLOBAL("meta_schedule.TensorInfoRepr").set_body_typed([](TensorInfo info) -> String {
+  return info->Repr();
+});
 
 }  // namespace meta_schedule
 }  // namespace tvm
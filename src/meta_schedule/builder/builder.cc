@@ -61,6 +61,46 @@ TVM_REGISTER_GLOBAL("meta_schedule.BuilderResult")
       return BuilderResult(artifact_path, error_msg);
     });
 
+TVM_REGISTER_GLOBAL("meta_schedule.BuilderInputArrayUnpack")
+    .set_body_typed([](Array<BuilderInput> build_inputs) -> Array<ObjectRef> {
+      Array<IRModule> mods;
+      Array<Target> targets;
+      mods.reserve(build_inputs.size());
+      targets.reserve(build_inputs.size());
+      for (const BuilderInput& build_input : build_inputs) {
+        mods.push_back(build_input->mod);
+        targets.push_back(build_input->target);
+      }
+      return {mods, targets};
+    });
+
+TVM_REGISTER_GLOBAL("meta_schedule.BuilderResultArrayPack")
+    .set_body_typed([](Array<ObjectRef> artifact_paths,
+                       Array<ObjectRef> error_msgs) -> Array<BuilderResult> {
+      ICHECK_EQ(artifact_paths.size(), error_msgs.size());
+      int n = artifact_paths.size();
+      Array<BuilderResult> results;
+      results.reserve(n);
+      for (int i = 0; i < n; ++i) {
+        results.push_back(BuilderResult(Downcast<Optional<String>>(artifact_paths[i]),
+                                        Downcast<Optional<String>>(error_msgs[i])));
+      }
+      return results;
+    });
+
+TVM_REGISTER_GLOBAL("meta_schedule.BuilderResultArrayUnpack")
+    .set_body_typed([](Array<BuilderResult> builder_results) -> Array<ObjectRef> {
+      Array<ObjectRef> artifact_paths;
+      Array<ObjectRef> error_msgs;
+      artifact_paths.reserve(builder_results.size());
+      error_msgs.reserve(builder_results.size());
+      for (const BuilderResult& builder_result : builder_results) {
+        artifact_paths.push_back(builder_result->artifact_path);
+        error_msgs.push_back(builder_result->error_msg);
+      }
+      return {artifact_paths, error_msgs};
+    });
+
 TVM_REGISTER_GLOBAL("meta_schedule.BuilderBuild").set_body_method<Builder>(&BuilderNode::Build);
 
 TVM_REGISTER_GLOBAL("meta_schedule.BuilderPyBuilder").set_body_typed(Builder::PyBuilder);
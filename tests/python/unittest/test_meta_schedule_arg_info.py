@@ -16,6 +16,10 @@
 # under the License.
 # pylint: disable=missing-module-docstring,missing-function-docstring,missing-class-docstring
 
+import sys
+
+import pytest
+
 import tvm
 from tvm import tir
 from tvm.meta_schedule.arg_info import ArgInfo, TensorInfo
@@ -57,6 +61,23 @@ def test_meta_schedule_tensor_info_from_json():
     assert str(info) == 'TensorInfo("float32", [1, 224, 224, 3])'
 
 
+def test_meta_schedule_arg_info_batch_json_roundtrip():
+    infos = [
+        TensorInfo("float32", [128, 256]),
+        TensorInfo("float32", [256, 512]),
+    ]
+    json_objs = ArgInfo.batch_as_json(infos)
+    assert json_objs == [
+        ["TENSOR", "float32", [128, 256]],
+        ["TENSOR", "float32", [256, 512]],
+    ]
+    parsed = ArgInfo.batch_from_json(json_objs)
+    assert [str(info) for info in parsed] == [
+        'TensorInfo("float32", [128, 256])',
+        'TensorInfo("float32", [256, 512])',
+    ]
+
+
 def test_meta_schedule_arg_info_from_prim_func():
     a_info, b_info, c_info = ArgInfo.from_prim_func(Matmul)
     assert str(a_info) == 'TensorInfo("float32", [128, 256])'
@@ -65,7 +86,4 @@ def test_meta_schedule_arg_info_from_prim_func():
 
 
 if __name__ == "__main__":
-    test_meta_schedule_tensor_info_creation()
-    test_meta_schedule_tensor_info_as_json()
-    test_meta_schedule_tensor_info_from_json()
-    test_meta_schedule_arg_info_from_prim_func()
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -16,21 +16,28 @@
 # under the License.
 """ Test Meta Schedule Builder """
 
+import getpass
 import os
+import shutil
 import sys
-import time
-from typing import List
+import tempfile
+import threading
+import uuid
+from typing import Dict, List
 
 import pytest
 
 from tvm import tir, script
 from tvm._ffi import register_func
+from tvm._ffi.libinfo import find_lib_path
+from tvm.ir import IRModule, load_json, save_json
 from tvm.meta_schedule.builder import (
     BuilderInput,
     BuilderResult,
     LocalBuilder,
     PyBuilder,
 )
+from tvm.meta_schedule.builder.local_builder import default_build
 from tvm.runtime import Module
 from tvm.script import ty
 from tvm.target import Target
@@ -90,40 +97,158 @@ class BatchMatmulModule:
 # pylint: enable=invalid-name,no-member,line-too-long,too-many-nested-blocks,missing-docstring
 
 
+# `Target` is immutable once parsed, so a single instance can be shared safely
+# by every builder input in this file instead of re-parsing "llvm" per test.
+_LLVM_TARGET = Target("llvm")
+
+
+# Parsed modules are also persisted here as JSON, keyed by the mtimes of this
+# file and of libtvm, so that later runs load them in ~1ms instead of
+# re-running the parser. The directory is per-user so that concurrent users of
+# a shared machine do not trip over each other's file permissions.
+_IR_CACHE_DIR = os.path.join(
+    tempfile.gettempdir(),
+    "tvm-test-ir-cache-" + getpass.getuser(),
+)
+_IR_CACHE_TAG = "{}-{}".format(
+    int(os.path.getmtime(__file__)),
+    int(os.path.getmtime(find_lib_path()[0])),
+)
+
+
+def _get_mod(script_mod) -> IRModule:
+    """Parse a TVMScript class into an IRModule, going through the on-disk cache.
+
+    Calling a `@script.tir`-decorated class re-runs the TVMScript parser each time,
+    so this is only invoked once per module to initialize the module-level
+    constants below; the tests only read the modules, so sharing is safe. The
+    first parse of each module is persisted to `_IR_CACHE_DIR` and reloaded by
+    later runs as long as neither this file nor the TVM build has changed.
+    """
+    cache_path = os.path.join(
+        _IR_CACHE_DIR,
+        "{}-{}.json".format(script_mod.__name__, _IR_CACHE_TAG),
+    )
+    if os.path.exists(cache_path):
+        with open(cache_path, "r") as cache_file:
+            return load_json(cache_file.read())
+    mod = script_mod()
+    os.makedirs(_IR_CACHE_DIR, exist_ok=True)
+    staging_path = "{}.tmp-{}".format(cache_path, os.getpid())
+    with open(staging_path, "w") as cache_file:
+        cache_file.write(save_json(mod))
+    os.replace(staging_path, cache_path)
+    return mod
+
+
+MATMUL_MOD = _get_mod(MatmulModule)
+MATMUL_RELU_MOD = _get_mod(MatmulReluModule)
+BATCH_MATMUL_MOD = _get_mod(BatchMatmulModule)
+
+
+_MEMORY_EXPORTED: Dict[str, bytes] = {}
+
+
+@register_func("meta_schedule.builder.test_memory_export")
+def _memory_export(mod: Module) -> str:
+    """Stash the built module in an in-memory dict instead of writing it to disk"""
+    artifact_path = "memory://" + uuid.uuid4().hex
+    _MEMORY_EXPORTED[artifact_path] = mod.get_source().encode()
+    return artifact_path
+
+
+def _create_builder(in_memory: bool) -> LocalBuilder:
+    """Create a LocalBuilder, optionally exporting artifacts in-memory.
+
+    The in-memory exporter stashes its output in `_MEMORY_EXPORTED`, which is only
+    visible to the test process, so it requires the in-process builder path.
+    """
+    if in_memory:
+        return LocalBuilder(
+            f_export="meta_schedule.builder.test_memory_export",
+            _use_signal_timeout=True,
+        )
+    return LocalBuilder()
+
+
+@pytest.fixture(scope="module", name="shared_builder")
+def shared_builder_fixture() -> LocalBuilder:
+    """A single in-process builder shared by the error-path tests.
+
+    Each test swaps in its own build/export functions via `override`, so one
+    builder instance covers all of them.
+    """
+    return LocalBuilder(_use_signal_timeout=True)
+
+
 def _check_build_results(builder_results: List[BuilderResult]):
     """Simple check whether the build is successful"""
-    for result in builder_results:
-        artifact_path = result.artifact_path
-        error_msg = result.error_msg
+    artifact_dirs = set()
+    artifact_paths, error_msgs = BuilderResult.batch_unpack(builder_results)
+    for artifact_path, error_msg in zip(artifact_paths, error_msgs):
         assert artifact_path is not None
         assert error_msg is None
-        os.remove(artifact_path)
-        os.rmdir(os.path.dirname(artifact_path))
-
-
-def test_meta_schedule_single_build():
+        if artifact_path.startswith("memory://"):
+            assert _MEMORY_EXPORTED.pop(artifact_path)
+        else:
+            assert os.path.exists(artifact_path)
+            artifact_dirs.add(os.path.dirname(artifact_path))
+    # Each artifact lives in its own temp dir; remove every dir in one pass
+    # instead of issuing per-artifact syscalls inside the loop.
+    for artifact_dir in artifact_dirs:
+        shutil.rmtree(artifact_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_meta_schedule_single_build(in_memory):
     """Test meta schedule builder for a single build"""
-    mod = MatmulModule()
-    builder = LocalBuilder()
-    builder_inputs = [BuilderInput(mod, Target("llvm"))]
+    mod = MATMUL_MOD
+    builder = _create_builder(in_memory)
+    builder_inputs = [BuilderInput(mod, _LLVM_TARGET)]
     builder_results = builder.build(builder_inputs)
     assert len(builder_results) == len(builder_inputs)
     _check_build_results(builder_results)
 
 
-def test_meta_schedule_multiple_build():
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_meta_schedule_multiple_build(in_memory):
     """Test meta schedule builder for multiple builds"""
-    builder = LocalBuilder()
+    builder = _create_builder(in_memory)
     builder_inputs = [
-        BuilderInput(MatmulModule(), Target("llvm")),
-        BuilderInput(MatmulReluModule(), Target("llvm")),
-        BuilderInput(BatchMatmulModule(), Target("llvm")),
+        BuilderInput(MATMUL_MOD, _LLVM_TARGET),
+        BuilderInput(MATMUL_RELU_MOD, _LLVM_TARGET),
+        BuilderInput(BATCH_MATMUL_MOD, _LLVM_TARGET),
     ]
     builder_results = builder.build(builder_inputs)
     assert len(builder_results) == len(builder_inputs)
     _check_build_results(builder_results)
 
 
+def test_meta_schedule_artifact_cache():
+    """Test that a second build of the same (mod, target) is served from the cache"""
+    num_builds: List[int] = []
+
+    @register_func("meta_schedule.builder.test_counting_build")
+    def counting_build(mod: IRModule, target: Target) -> Module:  # pylint: disable=unused-variable
+        num_builds.append(1)
+        return default_build(mod, target)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # The counting build function lives in the test process, so this needs
+        # the in-process builder path.
+        builder = LocalBuilder(
+            f_build="meta_schedule.builder.test_counting_build",
+            cache_dir=cache_dir,
+            _use_signal_timeout=True,
+        )
+        builder_inputs = [BuilderInput(MATMUL_MOD, _LLVM_TARGET)]
+        for _ in range(2):
+            builder_results = builder.build(builder_inputs)
+            assert len(builder_results) == len(builder_inputs)
+            _check_build_results(builder_results)
+    assert len(num_builds) == 1
+
+
 def test_meta_schedule_error_handle_test_builder():
     """Test the error handing during building"""
 
@@ -136,9 +261,9 @@ def test_meta_schedule_error_handle_test_builder():
 
     builder = TestBuilder()
     builder_inputs = [
-        BuilderInput(MatmulModule(), Target("llvm")),
-        BuilderInput(MatmulReluModule(), Target("llvm")),
-        BuilderInput(BatchMatmulModule(), Target("llvm")),
+        BuilderInput(MATMUL_MOD, _LLVM_TARGET),
+        BuilderInput(MATMUL_RELU_MOD, _LLVM_TARGET),
+        BuilderInput(BATCH_MATMUL_MOD, _LLVM_TARGET),
     ]
     builder_results = builder.build(builder_inputs)
     assert len(builder_results) == len(builder_inputs)
@@ -149,7 +274,7 @@ def test_meta_schedule_error_handle_test_builder():
         assert error_msg == "error"
 
 
-def test_meta_schedule_error_handle_build_func():
+def test_meta_schedule_error_handle_build_func(shared_builder):
     """Test the error handing during building"""
 
     def initializer():
@@ -157,9 +282,12 @@ def test_meta_schedule_error_handle_build_func():
         def test_build(mod: Module, target: Target) -> None:  # pylint: disable=unused-variable
             raise ValueError("Builder intended Test Error (build func).")
 
-    builder = LocalBuilder(f_build="meta_schedule.builder.test_build", initializer=initializer)
-    builder_inputs = [BuilderInput(MatmulModule(), Target("llvm"))]
-    builder_results = builder.build(builder_inputs)
+    builder_inputs = [BuilderInput(MATMUL_MOD, _LLVM_TARGET)]
+    with shared_builder.override(
+        f_build="meta_schedule.builder.test_build",
+        initializer=initializer,
+    ) as builder:
+        builder_results = builder.build(builder_inputs)
     assert len(builder_results) == len(builder_inputs)
     for result in builder_results:
         artifact_path = result.artifact_path
@@ -168,7 +296,7 @@ def test_meta_schedule_error_handle_build_func():
         assert error_msg.startswith("LocalBuilder: An exception occurred")
 
 
-def test_meta_schedule_error_handle_export_func():
+def test_meta_schedule_error_handle_export_func(shared_builder):
     """Test the error handing during building"""
 
     def initializer():
@@ -176,9 +304,12 @@ def test_meta_schedule_error_handle_export_func():
         def test_build(mod: Module) -> str:  # pylint: disable=unused-variable
             raise ValueError("Builder intended Test Error (export func).")
 
-    builder = LocalBuilder(f_export="meta_schedule.builder.test_export", initializer=initializer)
-    builder_inputs = [BuilderInput(MatmulModule(), Target("llvm"))]
-    builder_results = builder.build(builder_inputs)
+    builder_inputs = [BuilderInput(MATMUL_MOD, _LLVM_TARGET)]
+    with shared_builder.override(
+        f_export="meta_schedule.builder.test_export",
+        initializer=initializer,
+    ) as builder:
+        builder_results = builder.build(builder_inputs)
     assert len(builder_results) == len(builder_inputs)
     for result in builder_results:
         artifact_path = result.artifact_path
@@ -193,14 +324,17 @@ def test_meta_schedule_error_handle_time_out():
     def initializer():
         @register_func("meta_schedule.builder.test_time_out")
         def timeout_build(mod, target):  # pylint: disable=unused-argument, unused-variable
-            time.sleep(2)
+            # Block until the worker watchdog reports the timeout and the worker
+            # process is killed; unlike a fixed sleep, the stall never outlives
+            # `timeout_sec`, so the timeout can be made small.
+            threading.Event().wait()
 
     builder = LocalBuilder(
-        timeout_sec=1,
+        timeout_sec=0.1,
         f_build="meta_schedule.builder.test_time_out",
         initializer=initializer,
     )
-    builder_inputs = [BuilderInput(MatmulModule(), Target("llvm"))]
+    builder_inputs = [BuilderInput(MATMUL_MOD, _LLVM_TARGET)]
     builder_results = builder.build(builder_inputs)
     assert len(builder_results) == len(builder_inputs)
     for result in builder_results: